@@ -10,9 +10,17 @@ Improvements made:
 - Clean main loop and separation of concerns for easier testing
 """
 
-from typing import Tuple, List
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import AbstractSet, Any, Dict, Optional, Tuple, List
+import calendar
+import os
+import tempfile
 import time
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
 
 # Map of city name to CSV file name (used by load_data)
 CITY_DATA = {
@@ -21,25 +29,88 @@ CITY_DATA = {
     "washington": "washington.csv"
 }
 
+VALID_CITIES = list(CITY_DATA.keys())
 VALID_MONTHS = ["january", "february", "march", "april", "may", "june", "all"]
 VALID_DAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday", "all"]
+YES_NO = ["yes", "no"]
 
+# Set versions of the option lists for constant-time membership checks
+VALID_CITIES_SET = frozenset(VALID_CITIES)
+VALID_MONTHS_SET = frozenset(VALID_MONTHS)
+VALID_DAYS_SET = frozenset(VALID_DAYS)
+YES_NO_SET = frozenset(YES_NO)
 
-def get_valid_input(prompt: str, valid_options: List[str]) -> str:
+# Month numbers match Series.dt.month (1 = January), day numbers match
+# Series.dt.dayofweek (0 = Monday). INT_TO_MONTH covers all 12 months, since
+# the data may hold months that cannot be chosen as a filter.
+MONTH_TO_INT = {month: number for number, month in enumerate(VALID_MONTHS[:-1], start=1)}
+DAY_TO_INT = {day: number for number, day in enumerate(VALID_DAYS[:-1])}
+INT_TO_MONTH = {number: calendar.month_name[number].lower() for number in range(1, 13)}
+INT_TO_DAY = {number: day for day, number in DAY_TO_INT.items()}
+
+# Low-cardinality string columns converted to pandas "category" dtype
+CATEGORY_COLUMNS = ("Start Station", "End Station", "User Type", "Gender")
+
+# Parsed city DataFrames kept for the rest of the session, keyed by city
+_raw_cache: Dict[str, pd.DataFrame] = {}
+
+# Bump whenever the cached column layout changes so stale caches are ignored
+CACHE_VERSION = 5
+
+# CSV columns read by _load_or_cache; Gender and Birth Year are missing for some cities
+USED_COLUMNS = ["Start Time", "Start Station", "End Station", "Trip Duration", "User Type", "Gender", "Birth Year"]
+
+
+def _build_prefix_map(options: List[str]) -> Dict[str, str]:
+    """
+    Map every prefix that matches exactly one option to that option.
+
+    Args:
+        options: Lowercase list of valid answers.
+
+    Returns:
+        Dictionary of unambiguous prefix -> full option (full options included).
+    """
+    matches: Dict[str, List[str]] = {}
+    for option in options:
+        for end in range(1, len(option) + 1):
+            matches.setdefault(option[:end], []).append(option)
+
+    prefix_map = {prefix: found[0] for prefix, found in matches.items() if len(found) == 1}
+    prefix_map.update({option: option for option in options})
+    return prefix_map
+
+
+# Unambiguous abbreviations accepted at the month and day prompts (e.g. "jan", "th")
+MONTH_PREFIXES = _build_prefix_map(VALID_MONTHS)
+DAY_PREFIXES = _build_prefix_map(VALID_DAYS)
+
+
+def get_valid_input(
+    prompt: str,
+    valid_options: AbstractSet[str],
+    option_names: List[str],
+    prefixes: Optional[Dict[str, str]] = None,
+) -> str:
     """
     Prompt the user until they provide a valid response.
 
     Args:
         prompt: The prompt message shown to the user.
-        valid_options: Lowercase list of valid answers.
+        valid_options: Lowercase set of valid answers.
+        option_names: The same answers in display order, for the error message.
+        prefixes: Optional map of accepted abbreviations to full answers.
 
     Returns:
-        The validated user input (lowercased).
+        The validated user input (lowercased, abbreviations expanded).
     """
+    prefixes = prefixes or {}
     user_response = input(prompt).strip().lower()
+    user_response = prefixes.get(user_response, user_response)
     while user_response not in valid_options:
-        print(f"Invalid input. Choose one of: {', '.join(valid_options)}")
+        print(f"Invalid input. Choose one of: {', '.join(option_names)}")
         user_response = input(prompt).strip().lower()
+        user_response = prefixes.get(user_response, user_response)
     return user_response
 
 
@@ -54,20 +125,103 @@ def get_filters() -> Tuple[str, str, str]:
 
     # City input
     city_prompt = "Enter city (Chicago, New York City, Washington): "
-    selected_city = get_valid_input(city_prompt, list(CITY_DATA.keys()))
+    selected_city = get_valid_input(city_prompt, VALID_CITIES_SET, VALID_CITIES)
 
     # Month input
-    month_prompt = "Enter month (January - June) or 'all' to apply no month filter: "
-    selected_month = get_valid_input(month_prompt, VALID_MONTHS)
+    month_prompt = "Enter month (January - June, e.g. 'jan') or 'all' to apply no month filter: "
+    selected_month = get_valid_input(month_prompt, VALID_MONTHS_SET, VALID_MONTHS, MONTH_PREFIXES)
 
     # Day input
-    day_prompt = "Enter day of week (e.g., Monday) or 'all' to apply no day filter: "
-    selected_day = get_valid_input(day_prompt, VALID_DAYS)
+    day_prompt = "Enter day of week (e.g., Monday or 'mon') or 'all' to apply no day filter: "
+    selected_day = get_valid_input(day_prompt, VALID_DAYS_SET, VALID_DAYS, DAY_PREFIXES)
 
     print(f"\nFilters chosen → City: {selected_city.title()}, Month: {selected_month.title()}, Day: {selected_day.title()}\n")
     return selected_city, selected_month, selected_day
 
 
+def _load_or_cache(csv_file: str) -> pd.DataFrame:
+    """
+    Load a city CSV, reusing a sibling Parquet cache when it is up to date.
+
+    The cache stores the columns already typed ("Start Time" as datetime,
+    stations and user columns as category), so repeat runs skip the CSV parse.
+    A cache that cannot be read is treated as missing, and a cache that cannot
+    be written is skipped, so caching never stops the CSV from loading.
+
+    Args:
+        csv_file: path to the city CSV file
+
+    Returns:
+        Unfiltered pandas DataFrame.
+    """
+    parquet_path = csv_file.replace(".csv", f".v{CACHE_VERSION}.parquet")
+
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_file):
+        try:
+            return pd.read_parquet(parquet_path, engine="pyarrow")
+        except (OSError, pa.ArrowException):
+            pass  # truncated or corrupt cache: rebuild it from the CSV
+
+    # Read only the columns the stats use, typed during the multi-threaded
+    # Arrow parse; dictionary columns arrive in pandas as categoricals. The
+    # header also comes from Arrow, so one parser decides which columns exist.
+    with pacsv.open_csv(csv_file) as reader:
+        header = reader.schema.names
+    column_types = {"Start Time": pa.timestamp("ns")}
+    column_types.update({column: pa.dictionary(pa.int32(), pa.string()) for column in CATEGORY_COLUMNS})
+    convert_options = pacsv.ConvertOptions(
+        include_columns=[column for column in USED_COLUMNS if column in header],
+        column_types=column_types,
+        strings_can_be_null=True,
+    )
+    data_frame = pacsv.read_csv(csv_file, convert_options=convert_options).to_pandas()
+
+    # Shrink numeric columns to the smallest dtype that holds their values
+    data_frame["Trip Duration"] = pd.to_numeric(data_frame["Trip Duration"], downcast="integer")
+    if "Birth Year" in data_frame:
+        data_frame["Birth Year"] = pd.to_numeric(data_frame["Birth Year"], downcast="float")
+
+    _write_cache(data_frame, parquet_path)
+    return data_frame
+
+
+def _write_cache(data_frame: pd.DataFrame, parquet_path: str) -> None:
+    """
+    Write the Parquet cache atomically, skipping it if the write fails.
+
+    The frame goes to a temporary "<city>.vN.<random>.parquet" file in the
+    same directory first (so a leftover from a killed run is still covered by
+    .gitignore) and is then moved over parquet_path with os.replace, so an
+    interrupted write never leaves a partial cache behind. The file gets the
+    usual umask-based permissions rather than mkstemp's owner-only 0600.
+
+    Args:
+        data_frame: parsed city DataFrame to cache
+        parquet_path: final path of the cache file
+    """
+    directory, file_name = os.path.split(parquet_path)
+    try:
+        fd, temp_path = tempfile.mkstemp(
+            prefix=file_name[: -len("parquet")],
+            suffix=".parquet",
+            dir=directory or ".",
+        )
+    except OSError:
+        return  # e.g. a read-only data directory; run without the cache
+    os.close(fd)
+
+    umask = os.umask(0)
+    os.umask(umask)
+
+    try:
+        data_frame.to_parquet(temp_path, engine="pyarrow", compression="zstd")
+        os.chmod(temp_path, 0o666 & ~umask)
+        os.replace(temp_path, parquet_path)
+    except (OSError, pa.ArrowException):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
 def load_data(selected_city: str, selected_month: str, selected_day: str) -> pd.DataFrame:
     """
     Load city data into a DataFrame and apply month and day filters.
@@ -82,124 +236,220 @@ def load_data(selected_city: str, selected_month: str, selected_day: str) -> pd.
     """
     csv_file = CITY_DATA[selected_city]
 
-    try:
-        data_frame = pd.read_csv(csv_file)
-    except FileNotFoundError:
-        raise FileNotFoundError(f"CSV file not found for {selected_city}. Expected file: '{csv_file}'")
+    if selected_city not in _raw_cache:
+        try:
+            _raw_cache[selected_city] = _load_or_cache(csv_file)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"CSV file not found for {selected_city}. Expected file: '{csv_file}'")
+
+    data_frame = _raw_cache[selected_city]
+
+    # Filter with one boolean mask built straight from Start Time. The month
+    # and day values computed for the mask are sliced and reused as the
+    # helper columns; the start hour is only needed once, so compute_all_stats
+    # derives it. Nullable Int8 keeps blank Start Time cells (NaT) in the frame.
+    start_times = data_frame["Start Time"].dt
+    months = start_times.month.astype("Int8")
+    days = None
+    mask = None
+    if selected_month != "all":
+        mask = (months == MONTH_TO_INT[selected_month]).to_numpy(dtype=bool, na_value=False)
+    if selected_day != "all":
+        days = start_times.dayofweek.astype("Int8")
+        day_mask = (days == DAY_TO_INT[selected_day]).to_numpy(dtype=bool, na_value=False)
+        mask = day_mask if mask is None else mask & day_mask
+
+    # Index only when a filter is set; indexing copies the surviving rows once
+    # and leaves the cached frame alone
+    if mask is not None:
+        data_frame = data_frame[mask]
+        months = months[mask]
+        if days is not None:
+            days = days[mask]
+    if days is None:
+        days = data_frame["Start Time"].dt.dayofweek.astype("Int8")
+
+    # Categories emptied by the filters are dropped so value_counts stays
+    # concise. Everything goes through one assign() call, so neither the
+    # cached nor the filtered frame is modified in place.
+    derived_columns = {"month": months, "day_of_week": days}
+    for column in CATEGORY_COLUMNS:
+        if column in data_frame.columns:
+            derived_columns[column] = data_frame[column].cat.remove_unused_categories()
+
+    return data_frame.assign(**derived_columns)
+
+
+def _top(series: pd.Series) -> Any:
+    """
+    Return the most frequent non-null value of a Series.
 
-    # Convert Start Time to datetime and create helper columns
-    data_frame["Start Time"] = pd.to_datetime(data_frame["Start Time"])
-    data_frame["month"] = data_frame["Start Time"].dt.month_name().str.lower()
-    data_frame["day_of_week"] = data_frame["Start Time"].dt.day_name().str.lower()
-    data_frame["hour"] = data_frame["Start Time"].dt.hour
+    Ties go to the smallest tied value, as with Series.mode(). Categorical
+    columns are counted straight from their integer codes with np.bincount.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+        return series.cat.categories[counts == counts.max()].min()
+    counts = series.value_counts(sort=True)
+    return counts[counts == counts.iat[0]].index.min()
 
-    # Apply filters
-    if selected_month != "all":
-        data_frame = data_frame[data_frame["month"] == selected_month]
 
-    if selected_day != "all":
-        data_frame = data_frame[data_frame["day_of_week"] == selected_day]
+def compute_all_stats(data_frame: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Compute every statistic shown by the display functions in one call.
 
-    return data_frame
+    The Trip Duration and Birth Year sums, means and extremes come from a
+    single DataFrame.agg call. Each other statistic is one count over its
+    column, and the display functions only print the returned values.
 
+    Args:
+        data_frame: filtered DataFrame returned by load_data
 
-def time_stats(data_frame: pd.DataFrame) -> None:
+    Returns:
+        Dictionary of statistics; empty when data_frame has no rows.
+    """
+    if data_frame.empty:
+        return {}
+
+    # The user-column counts are independent and spend their time in
+    # NumPy/pandas C code, so they run on worker threads alongside the rest
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        user_futures = {}
+        if "User Type" in data_frame:
+            user_futures["user_types"] = executor.submit(data_frame["User Type"].value_counts)
+        if "Gender" in data_frame:
+            user_futures["gender"] = executor.submit(data_frame["Gender"].value_counts)
+        if "Birth Year" in data_frame:
+            user_futures["birth_year_mode"] = executor.submit(_top, data_frame["Birth Year"])
+
+        aggregations = {"Trip Duration": ["sum", "mean"]}
+        if "Birth Year" in data_frame:
+            aggregations["Birth Year"] = ["min", "max"]
+        totals = data_frame.agg(aggregations)
+
+        # Ties go to the smallest (start, end) pair, like _top; min() over the
+        # tuples compares station names rather than category codes
+        trip_counts = data_frame.groupby(["Start Station", "End Station"], observed=True, sort=False).size()
+
+        stats = {
+            "month": _top(data_frame["month"]),
+            "day_of_week": _top(data_frame["day_of_week"]),
+            "hour": _top(data_frame["Start Time"].dt.hour),
+            "start_station": _top(data_frame["Start Station"]),
+            "end_station": _top(data_frame["End Station"]),
+            "trip": min(trip_counts[trip_counts == trip_counts.max()].index),
+            "total_duration": totals.at["sum", "Trip Duration"],
+            "mean_duration": totals.at["mean", "Trip Duration"],
+        }
+
+    if "user_types" in user_futures:
+        stats["user_types"] = user_futures["user_types"].result()
+    if "gender" in user_futures:
+        stats["gender"] = user_futures["gender"].result()
+    if "birth_year_mode" in user_futures:
+        stats["birth_year"] = (
+            totals.at["min", "Birth Year"],
+            totals.at["max", "Birth Year"],
+            user_futures["birth_year_mode"].result(),
+        )
+
+    return stats
+
+
+def time_stats(stats: Dict[str, Any]) -> None:
     """Display statistics on the most frequent times of travel."""
-    print("\nCalculating Most Frequent Travel Times...\n")
-    start_time = time.time()
+    print("\nMost Frequent Travel Times\n")
 
-    if data_frame.empty:
+    if not stats:
         print("No data available for selected filters.")
         return
 
-    print(f"Most common month: {data_frame['month'].mode()[0].title()}")
-    print(f"Most common day: {data_frame['day_of_week'].mode()[0].title()}")
-    print(f"Most common hour: {int(data_frame['hour'].mode()[0])}:00")
+    print(f"Most common month: {INT_TO_MONTH[stats['month']].title()}")
+    print(f"Most common day: {INT_TO_DAY[stats['day_of_week']].title()}")
+    print(f"Most common hour: {int(stats['hour'])}:00")
 
-    print(f"\nCompleted in {(time.time() - start_time):.4f} seconds.")
 
-
-def station_stats(data_frame: pd.DataFrame) -> None:
+def station_stats(stats: Dict[str, Any]) -> None:
     """Display statistics on the most popular stations and trip."""
-    print("\nCalculating Station Statistics...\n")
-    start_time = time.time()
+    print("\nStation Statistics\n")
 
-    if data_frame.empty:
+    if not stats:
         print("No data available for selected filters.")
         return
 
-    print(f"Most common start station: {data_frame['Start Station'].mode()[0]}")
-    print(f"Most common end station: {data_frame['End Station'].mode()[0]}")
+    print(f"Most common start station: {stats['start_station']}")
+    print(f"Most common end station: {stats['end_station']}")
 
-    data_frame["trip_combo"] = data_frame["Start Station"] + " → " + data_frame["End Station"]
-    print(f"Most frequent trip: {data_frame['trip_combo'].mode()[0]}")
+    start_station, end_station = stats["trip"]
+    print(f"Most frequent trip: {start_station} → {end_station}")
 
-    print(f"\nCompleted in {(time.time() - start_time):.4f} seconds.")
 
-
-def trip_duration_stats(data_frame: pd.DataFrame) -> None:
+def trip_duration_stats(stats: Dict[str, Any]) -> None:
     """Display statistics on total and average trip duration."""
-    print("\nCalculating Trip Duration Stats...\n")
-    start_time = time.time()
+    print("\nTrip Duration Stats\n")
 
-    if data_frame.empty:
+    if not stats:
         print("No data available for selected filters.")
         return
 
-    print(f"Total travel time: {int(data_frame['Trip Duration'].sum())} seconds")
-    print(f"Average travel time: {data_frame['Trip Duration'].mean():.2f} seconds")
+    print(f"Total travel time: {int(stats['total_duration'])} seconds")
+    print(f"Average travel time: {stats['mean_duration']:.2f} seconds")
 
-    print(f"\nCompleted in {(time.time() - start_time):.4f} seconds.")
 
-
-def user_stats(data_frame: pd.DataFrame) -> None:
+def user_stats(stats: Dict[str, Any]) -> None:
     """Display statistics on bikeshare users."""
-    print("\nCalculating User Stats...\n")
-    start_time = time.time()
+    print("\nUser Stats\n")
 
-    if data_frame.empty:
+    if not stats:
         print("No data available for selected filters.")
         return
 
     # User Types
-    if "User Type" in data_frame:
+    if "user_types" in stats:
         print("User Types:")
-        print(data_frame["User Type"].value_counts().to_string())
+        print(stats["user_types"].to_string())
     else:
         print("User Type data not available.")
 
     # Gender
-    if "Gender" in data_frame:
+    if "gender" in stats:
         print("\nGender Breakdown:")
-        print(data_frame["Gender"].value_counts().to_string())
+        print(stats["gender"].to_string())
     else:
         print("\nGender data not available.")
 
     # Birth Year
-    if "Birth Year" in data_frame:
-        print(f"\nEarliest birth year: {int(data_frame['Birth Year'].min())}")
-        print(f"Most recent birth year: {int(data_frame['Birth Year'].max())}")
-        print(f"Most common birth year: {int(data_frame['Birth Year'].mode()[0])}")
+    if "birth_year" in stats:
+        earliest, most_recent, most_common = stats["birth_year"]
+        print(f"\nEarliest birth year: {int(earliest)}")
+        print(f"Most recent birth year: {int(most_recent)}")
+        print(f"Most common birth year: {int(most_common)}")
     else:
         print("\nBirth Year data not available.")
 
-    print(f"\nCompleted in {(time.time() - start_time):.4f} seconds.")
-
 
 def display_raw_data(data_frame: pd.DataFrame) -> None:
     """Prompt user to display raw data 5 rows at a time."""
-    start_loc = 0
+    columns = list(data_frame.columns)
+    # month and day_of_week hold numbers internally; show them as names
+    value_names = [{"month": INT_TO_MONTH, "day_of_week": INT_TO_DAY}.get(column, {}) for column in columns]
+    rows = data_frame.itertuples(index=False, name=None)
+    rows_shown = 0
 
     while True:
-        view_data = get_valid_input("Would you like to view 5 rows of raw data? (yes/no): ", ["yes", "no"])
+        view_data = get_valid_input("Would you like to view 5 rows of raw data? (yes/no): ", YES_NO_SET, YES_NO)
 
         if view_data == "no":
             break
 
-        print(data_frame.iloc[start_loc:start_loc + 5])
-        start_loc += 5
+        for row in islice(rows, 5):
+            print(", ".join(
+                f"{column}: {names.get(value, value)}" for column, names, value in zip(columns, value_names, row)
+            ))
+            rows_shown += 1
 
-        if start_loc >= len(data_frame):
+        if rows_shown >= len(data_frame):
             print("No more data to display.")
             break
 
@@ -210,13 +460,18 @@ def main() -> None:
         selected_city, selected_month, selected_day = get_filters()
         data_frame = load_data(selected_city, selected_month, selected_day)
 
-        time_stats(data_frame)
-        station_stats(data_frame)
-        trip_duration_stats(data_frame)
-        user_stats(data_frame)
+        print("\nCalculating statistics...")
+        start_ns = time.perf_counter_ns()
+        stats = compute_all_stats(data_frame)
+        print(f"Completed in {(time.perf_counter_ns() - start_ns) / 1e9:.4f} seconds.")
+
+        time_stats(stats)
+        station_stats(stats)
+        trip_duration_stats(stats)
+        user_stats(stats)
         display_raw_data(data_frame)
 
-        restart = get_valid_input("Would you like to restart? (yes/no): ", ["yes", "no"])
+        restart = get_valid_input("Would you like to restart? (yes/no): ", YES_NO_SET, YES_NO)
         if restart == "no":
             print("Goodbye!")
             break